@@ -0,0 +1,31 @@
+import React from 'react';
+import { Sparkles, Loader2, X } from 'lucide-react';
+
+const AiModal = React.memo(function AiModal({ title, loading, response, onClose }) {
+  return (
+    <div className="fixed inset-0 z-50 flex items-center justify-center bg-black/80 backdrop-blur-sm p-4 animate-in fade-in duration-200">
+      <div className="bg-zinc-900 border border-zinc-700 w-full max-w-lg rounded-2xl shadow-2xl overflow-hidden flex flex-col max-h-[80vh]">
+        <div className="p-4 border-b border-zinc-800 flex items-center justify-between bg-zinc-900/50">
+          <h3 className="font-semibold text-blue-400 flex items-center gap-2">
+            <Sparkles size={18} /> {title}
+          </h3>
+          <button onClick={onClose} className="p-1 hover:bg-zinc-800 rounded-lg">
+            <X size={20} className="text-zinc-500" />
+          </button>
+        </div>
+        <div className="p-6 overflow-y-auto bg-zinc-950/50">
+          {loading ? (
+            <div className="flex flex-col items-center justify-center py-12 gap-4">
+              <Loader2 size={32} className="animate-spin text-blue-500" />
+              <p className="text-zinc-500 text-sm animate-pulse">Analyzing...</p>
+            </div>
+          ) : (
+            <p className="whitespace-pre-wrap leading-relaxed text-zinc-300">{response}</p>
+          )}
+        </div>
+      </div>
+    </div>
+  );
+});
+
+export default AiModal;
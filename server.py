@@ -1,18 +1,264 @@
-import React, { useState, useEffect, useRef } from 'react';
+import React, { useState, useEffect, useRef, useMemo, useCallback, Suspense } from 'react';
+import { unstable_batchedUpdates } from 'react-dom';
 import { 
-  AreaChart, Area, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer 
+  AreaChart, Area, XAxis, YAxis, CartesianGrid, Tooltip 
 } from 'recharts';
 import { 
   Cpu, Database, HardDrive, Activity, Terminal, LayoutDashboard, 
   Server, Network, Pause, Play, ChevronRight, BrainCircuit, 
-  Settings, Bell, Search, Sparkles, Loader2, X 
+  Settings, Bell, Search, Sparkles 
 } from 'lucide-react';
 
+const MAX_HISTORY = 30;
+// Built once: constructing a DateTimeFormat is the expensive part of toLocaleTimeString
+const TIME_FMT = new Intl.DateTimeFormat('en-US', { hour12: false, hour: "2-digit", minute: "2-digit", second: "2-digit" });
+
+const EMPTY_SAMPLE = { cpu: 0, memory: 0, disk: 0, network: 0 };
+const HISTORY_CACHE_KEY = 'sentinel:hist';
+const HISTORY_CACHE_THROTTLE_MS = 5000;
+const CHART_THROTTLE_MS = 250;
+const POLL_INTERVAL_MS = 1000;
+const MAX_BACKOFF_MS = 30000;
+const PERF_SAMPLES = 100;
+const AI_CACHE_SIZE = 16;
+
+// Hidden tabs are treated exactly like a user pause
+const streamCommand = (paused) => (paused || document.hidden ? 'pause' : 'resume');
+
+// Exponential backoff (1s, 2s, 4s, ... capped at 30s) with +/-100ms jitter so several tabs don't probe in lockstep
+const backoffDelay = (failCount) =>
+  Math.min(MAX_BACKOFF_MS, POLL_INTERVAL_MS * Math.pow(2, failCount)) + (Math.random() * 200 - 100);
+
+// sessionStorage can throw (quota, privacy mode, blocked storage); the warm-start cache is best-effort
+const dropHistoryCache = () => {
+  try {
+    sessionStorage.removeItem(HISTORY_CACHE_KEY);
+  } catch (error) {
+    // Storage unavailable; nothing to clear
+  }
+};
+
+// Oldest-to-newest copy of a cyclic buffer whose next write slot is `head`
+const readRing = (buf, head, size = MAX_HISTORY) => {
+  const out = [];
+  const n = Math.min(head, size);
+  for (let i = 0; i < n; i++) out.push(buf[(head - n + i) % size]);
+  return out;
+};
+
+const percentile = (sorted, p) =>
+  sorted.length ? sorted[Math.min(sorted.length - 1, Math.floor(p * sorted.length))] : 0;
+
+// Snapshot of the client-side probe: fetch latency percentiles plus counters
+const summarizePerf = (perf) => {
+  const fetches = readRing(perf.fetches, perf.fetchHead, PERF_SAMPLES);
+  const durations = fetches.map(f => f.dur).sort((a, b) => a - b);
+  return {
+    fetches: fetches.length,
+    errors: fetches.filter(f => !f.ok).length,
+    p50: Math.round(percentile(durations, 0.5)),
+    p95: Math.round(percentile(durations, 0.95)),
+    cacheHits: perf.cacheHits,
+    dropped: perf.dropped,
+    failCount: perf.failCount,
+  };
+};
+
+const NAV_ITEMS = [
+  { id: 'dashboard', icon: LayoutDashboard, label: 'Overview' },
+  { id: 'network', icon: Network, label: 'Network' },
+  { id: 'logs', icon: Terminal, label: 'Logs' },
+];
+
+// Static gradient, created once rather than on every chart render
+const CHART_DEFS = (
+  <defs>
+    <linearGradient id="chartGradient" x1="0" y1="0" x2="0" y2="1">
+      <stop offset="5%" stopColor="#3b82f6" stopOpacity={0.3}/>
+      <stop offset="95%" stopColor="#3b82f6" stopOpacity={0}/>
+    </linearGradient>
+  </defs>
+);
+
+// Full class strings so Tailwind's purge can see them (no `bg-${color}-500` interpolation)
+const COLOR_STYLES = {
+  blue: { active: 'bg-blue-500/10 border-blue-500/50 ring-1 ring-blue-500/50', icon: 'bg-blue-500/20 text-blue-400', bar: 'bg-blue-500' },
+  purple: { active: 'bg-purple-500/10 border-purple-500/50 ring-1 ring-purple-500/50', icon: 'bg-purple-500/20 text-purple-400', bar: 'bg-purple-500' },
+  amber: { active: 'bg-amber-500/10 border-amber-500/50 ring-1 ring-amber-500/50', icon: 'bg-amber-500/20 text-amber-400', bar: 'bg-amber-500' },
+  emerald: { active: 'bg-emerald-500/10 border-emerald-500/50 ring-1 ring-emerald-500/50', icon: 'bg-emerald-500/20 text-emerald-400', bar: 'bg-emerald-500' },
+};
+
+// --- UI Components ---
+// Module-scoped + memoized so a card only re-renders when its own reading or the selection changes
+const MetricCard = React.memo(function MetricCard({ title, value, unit, icon: Icon, metricKey, color, trend, selectedMetric, onSelect }) {
+  const styles = COLOR_STYLES[color];
+  return (
+    <button 
+      onClick={() => onSelect(metricKey)}
+      className={`relative group overflow-hidden rounded-2xl border p-5 text-left transition-all duration-300 ${
+        selectedMetric === metricKey 
+          ? styles.active
+          : 'bg-zinc-900/50 border-white/5 hover:bg-zinc-800/50 hover:border-white/10'
+      }`}
+    >
+      <div className="flex justify-between items-start mb-4">
+        <div className={`p-2 rounded-lg ${styles.icon}`}>
+          <Icon size={20} />
+        </div>
+        <span className={`text-xs font-mono px-2 py-1 rounded-full ${
+          trend === 'up' ? 'bg-red-500/20 text-red-400' : 'bg-emerald-500/20 text-emerald-400'
+        }`}>
+          {trend === 'up' ? '↑ High' : '↓ Stable'}
+        </span>
+      </div>
+      <div>
+        <p className="text-zinc-500 text-xs font-medium uppercase tracking-wider">{title}</p>
+        <h3 className="text-2xl font-bold text-white mt-1">
+          {value} <span className="text-sm text-zinc-500 font-normal">{unit}</span>
+        </h3>
+      </div>
+      {selectedMetric === metricKey && (
+        <div className={`absolute bottom-0 left-0 w-full h-1 ${styles.bar} animate-pulse`} />
+      )}
+    </button>
+  );
+}, (a, b) => a.value === b.value && a.selectedMetric === b.selectedMetric && a.trend === b.trend);
+
+const NavButton = React.memo(function NavButton({ item, active, onSelect }) {
+  return (
+    <button onClick={() => onSelect(item.id)} className={`w-full flex items-center gap-3 px-4 py-3 rounded-xl transition-all ${active ? 'bg-blue-600/10 text-blue-400 border border-blue-600/20' : 'text-zinc-500 hover:bg-white/5'}`}>
+      <item.icon size={20} />
+      <span className="hidden lg:block text-sm font-medium">{item.label}</span>
+      {active && <ChevronRight size={14} className="ml-auto hidden lg:block" />}
+    </button>
+  );
+});
+
+const MethodButton = React.memo(function MethodButton({ method, label, active, onSelect }) {
+  return (
+    <button onClick={() => onSelect(method)} className={`px-4 py-2 rounded-lg text-xs font-bold ${active ? 'bg-zinc-800 text-white' : 'text-zinc-500'}`}>{label}</button>
+  );
+});
+
+const Sidebar = React.memo(function Sidebar({ activeView, onSelect }) {
+  return (
+    <aside className="w-20 lg:w-64 border-r border-white/5 flex flex-col bg-zinc-900/30 backdrop-blur-xl">
+      <div className="p-6 flex items-center gap-3 text-blue-500">
+        <BrainCircuit size={28} className="animate-pulse" />
+        <span className="font-bold text-xl tracking-tight hidden lg:block text-white">Sentin<span className="text-blue-500">el</span></span>
+      </div>
+      <nav className="flex-1 px-4 py-6 space-y-2">
+        {NAV_ITEMS.map(item => (
+          <NavButton key={item.id} item={item} active={activeView === item.id} onSelect={onSelect} />
+        ))}
+      </nav>
+    </aside>
+  );
+});
+
+const Header = React.memo(function Header({ dataSource, onDiagnostics }) {
+  return (
+    <header className="h-16 border-b border-white/5 flex items-center justify-between px-8 bg-zinc-900/30 backdrop-blur-sm z-10">
+      <div className="flex items-center gap-4">
+        <h2 className="text-lg font-semibold">System Overview</h2>
+        <div className={`px-3 py-1 rounded-full border flex items-center gap-2 ${dataSource === 'LIVE' ? 'bg-emerald-500/10 border-emerald-500/20' : 'bg-amber-500/10 border-amber-500/20'}`}>
+          <div className={`w-1.5 h-1.5 rounded-full animate-pulse ${dataSource === 'LIVE' ? 'bg-emerald-500' : 'bg-amber-500'}`}></div>
+          <span className={`text-xs font-medium ${dataSource === 'LIVE' ? 'text-emerald-400' : 'text-amber-400'}`}>
+            {dataSource === 'LIVE' ? 'Connected to Localhost' : 'Simulation Mode'}
+          </span>
+        </div>
+      </div>
+      <button onClick={onDiagnostics} className="flex items-center gap-2 px-4 py-1.5 bg-blue-600 hover:bg-blue-500 text-white rounded-full text-sm font-medium shadow-lg shadow-blue-500/20 transition-all">
+        <Sparkles size={14} /> AI Diagnostics
+      </button>
+    </header>
+  );
+});
+
+// Takes the newest readings as scalars, so an unchanged sample doesn't re-render the grid
+const MetricsGrid = React.memo(function MetricsGrid({ cpu, memory, disk, network, selectedMetric, onSelect }) {
+  return (
+    <div className="grid grid-cols-1 md:grid-cols-4 gap-4">
+      <MetricCard title="CPU" value={cpu || 0} unit="%" icon={Cpu} metricKey="cpu" color="blue" trend="up" selectedMetric={selectedMetric} onSelect={onSelect} />
+      <MetricCard title="RAM" value={memory || 0} unit="%" icon={Database} metricKey="memory" color="purple" trend="down" selectedMetric={selectedMetric} onSelect={onSelect} />
+      <MetricCard title="DISK" value={disk || 0} unit="%" icon={HardDrive} metricKey="disk" color="amber" trend="down" selectedMetric={selectedMetric} onSelect={onSelect} />
+      <MetricCard title="NET" value={network || 0} unit="Mb" icon={Activity} metricKey="network" color="emerald" trend="down" selectedMetric={selectedMetric} onSelect={onSelect} />
+    </div>
+  );
+});
+
+const ChartPanel = React.memo(function ChartPanel({ chartData, selectedMetric, isPaused, onTogglePause }) {
+  const plotRef = useRef(null);
+  const [dims, setDims] = useState({ w: 0, h: 0 });
+
+  // Measure only on real resizes, instead of ResponsiveContainer re-measuring on every parent render
+  useEffect(() => {
+    const ro = new ResizeObserver(([entry]) => {
+      const w = Math.floor(entry.contentRect.width);
+      const h = Math.floor(entry.contentRect.height);
+      setDims(prev => (prev.w === w && prev.h === h ? prev : { w, h }));
+    });
+    ro.observe(plotRef.current);
+    return () => ro.disconnect();
+  }, []);
+
+  // Recharts is expensive to reconcile; a pause toggle alone shouldn't rebuild it
+  const chartEl = useMemo(() => (dims.w > 0 && dims.h > 0) && (
+    <AreaChart width={dims.w} height={dims.h} data={chartData}>
+      {CHART_DEFS}
+      <CartesianGrid strokeDasharray="3 3" stroke="#27272a" vertical={false} />
+      <XAxis dataKey="time" stroke="#52525b" fontSize={10} tickLine={false} axisLine={false} />
+      <YAxis stroke="#52525b" fontSize={10} tickLine={false} axisLine={false} />
+      <Tooltip contentStyle={{ backgroundColor: '#09090b', borderColor: '#27272a' }} itemStyle={{ color: '#fff' }} />
+      <Area type="monotone" dataKey={selectedMetric} stroke="#3b82f6" strokeWidth={2} fill="url(#chartGradient)" />
+    </AreaChart>
+  ), [chartData, selectedMetric, dims]);
+
+  return (
+    <div className="bg-zinc-900/50 border border-white/5 rounded-2xl p-6 backdrop-blur-sm h-[400px] flex flex-col">
+      <div className="flex justify-between mb-4">
+        <h3 className="text-lg font-semibold flex gap-2 items-center text-white">
+          <Activity size={18} className="text-blue-400"/> Real-time Monitor ({selectedMetric.toUpperCase()})
+        </h3>
+        <div className="flex gap-2">
+          <button onClick={onTogglePause} className="p-2 border border-zinc-700 rounded-lg text-zinc-400 hover:text-white">
+            {isPaused ? <Play size={16} /> : <Pause size={16} />}
+          </button>
+        </div>
+      </div>
+      <div ref={plotRef} className="flex-1 min-h-0">
+        {chartEl}
+      </div>
+    </div>
+  );
+});
+
+const MethodToggle = React.memo(function MethodToggle({ activeMethod, onSelect }) {
+  return (
+    <div className="bg-zinc-900/30 border border-white/10 rounded-2xl p-6 flex justify-between items-center">
+      <div>
+        <h3 className="font-bold text-white mb-1">Analysis Method</h3>
+        <p className="text-zinc-500 text-sm">
+          {activeMethod === 'USE' ? "Utilization • Saturation • Errors (Best for Hardware)" : "Rate • Errors • Duration (Best for APIs)"}
+        </p>
+      </div>
+      <div className="bg-black/40 p-1 rounded-xl border border-white/5 flex">
+        <MethodButton method="USE" label="U.S.E." active={activeMethod === 'USE'} onSelect={onSelect} />
+        <MethodButton method="RED" label="R.E.D." active={activeMethod === 'RED'} onSelect={onSelect} />
+      </div>
+    </div>
+  );
+});
+
+// Diagnostics UI (and its icons) is code-split and only fetched on the first AI Diagnostics click
+const AiModal = React.lazy(() => import('./AiModal'));
+
 const App = () => {
   const [activeView, setActiveView] = useState('dashboard');
   const [isPaused, setIsPaused] = useState(false);
   const [selectedMetric, setSelectedMetric] = useState('cpu'); 
-  const [history, setHistory] = useState([]);
+  const [historyVersion, setHistoryVersion] = useState(0);
+  const [chartVersion, setChartVersion] = useState(0);
   const [logs, setLogs] = useState([]);
   const [activeMethod, setActiveMethod] = useState('USE');
   const [dataSource, setDataSource] = useState('CONNECTING...'); // 'LIVE' or 'SIMULATION'
@@ -24,24 +270,142 @@ const App = () => {
   const [aiTitle, setAiTitle] = useState('');
 
   const scrollRef = useRef(null);
-  const MAX_HISTORY = 30;
+  const ws = useRef(null);
+  const simWorker = useRef(null);
+  const isPausedRef = useRef(isPaused);
+  const dataSourceRef = useRef(dataSource);
+  const simWantedRef = useRef(false);
+  const simRunningRef = useRef(false);
+  const aiCache = useRef(new Map()); // insertion-ordered Map used as a small LRU
+  const aiAbortRef = useRef(null);
+
+  // Only touch state when the mode actually flips, not on every sample
+  const updateDataSource = useCallback((source) => {
+    if (dataSourceRef.current === source) return;
+    dataSourceRef.current = source;
+    setDataSource(source);
+  }, []);
+
+  // The worker only runs while the backend is down and someone is actually watching
+  const syncSimulation = useCallback(() => {
+    const run = simWantedRef.current && !isPausedRef.current && !document.hidden;
+    if (run === simRunningRef.current) return;
+    simRunningRef.current = run;
+    simWorker.current?.postMessage(run ? 'start' : 'stop');
+  }, []);
+
+  // Fixed-size cyclic buffer: O(1) insert, no per-tick array copies
+  const bufRef = useRef(new Array(MAX_HISTORY).fill(null));
+  const headRef = useRef(0);
+  const lastCacheWriteRef = useRef(0);
+  const lastChartFlushRef = useRef(0);
+  const chartTimerRef = useRef(null);
+
+  // --- Perf Probe: bounded fetch timings + counters, readable from devtools/RUM via window.__sentinelPerf ---
+  const perfRef = useRef({ fetches: new Array(PERF_SAMPLES).fill(null), fetchHead: 0, cacheHits: 0, dropped: 0, failCount: 0 });
+  const showPerf = useMemo(() => new URLSearchParams(window.location.search).has('perf'), []);
+
+  useEffect(() => {
+    const perf = perfRef.current;
+    window.__sentinelPerf = { raw: perf, summary: () => summarizePerf(perf) };
+    return () => { delete window.__sentinelPerf; };
+  }, []);
 
-  // --- Data Engine (Dual Mode: Live vs Simulation) ---
+  // --- Warm Start: repaint the last LIVE samples from this session before the first one arrives ---
   useEffect(() => {
-    if (isPaused) return;
+    try {
+      const cached = JSON.parse(sessionStorage.getItem(HISTORY_CACHE_KEY));
+      if (!Array.isArray(cached) || cached.length === 0) return;
+      cached.filter(p => p.live).slice(-MAX_HISTORY).forEach((point) => {
+        bufRef.current[headRef.current % MAX_HISTORY] = point;
+        headRef.current++;
+      });
+      perfRef.current.cacheHits++;
+      setHistoryVersion(v => v + 1);
+    } catch (error) {
+      dropHistoryCache();
+    }
+  }, []);
+
+  // Simulated samples must never be served as a LIVE warm start
+  useEffect(() => {
+    if (dataSource === 'SIMULATION') dropHistoryCache();
+  }, [dataSource]);
+
+  // --- Data Engine (Live Stream, falling back to Polling / Simulation) ---
+  useEffect(() => {
+    let pollTimer = null;
+    let pollGen = 0;
+    let failCount = 0;
+    let nextProbeAt = 0;
+    let wsRetries = 0;
+    let reconnectTimer = null;
+    let closed = false;
+
+    const pushPoint = (point, live) => {
+      // psutil often repeats itself; an unchanged reading isn't worth a render
+      const last = headRef.current ? bufRef.current[(headRef.current - 1) % MAX_HISTORY] : null;
+      if (last && last.cpu === point.cpu && last.memory === point.memory && last.disk === point.disk && last.network === point.network) return;
+
+      bufRef.current[headRef.current % MAX_HISTORY] = { ...point, live };
+      headRef.current++;
+      setHistoryVersion(v => v + 1);
+
+      const now = Date.now();
+      if (live && now - lastCacheWriteRef.current >= HISTORY_CACHE_THROTTLE_MS) {
+        lastCacheWriteRef.current = now;
+        try {
+          // The buffer may still hold simulated points from before the backend came back; never cache those
+          const livePoints = readRing(bufRef.current, headRef.current).filter(p => p.live);
+          sessionStorage.setItem(HISTORY_CACHE_KEY, JSON.stringify(livePoints));
+        } catch (error) {
+          // Storage full or disabled; the cache is best-effort
+        }
+      }
+    };
+
+    const setSimulating = (wanted) => {
+      simWantedRef.current = wanted;
+      syncSimulation();
+    };
+
+    // Simulation samples are generated in a worker so the math stays off the UI thread
+    simWorker.current = new Worker(new URL('./sim.worker.js', import.meta.url));
+    simWorker.current.onmessage = (e) => {
+      // A sample may already be queued when 'stop' is posted; it must not flip us back to SIMULATION
+      if (!simRunningRef.current) return;
+      if (isPausedRef.current || document.hidden) {
+        perfRef.current.dropped++;
+        return;
+      }
+      unstable_batchedUpdates(() => {
+        updateDataSource('SIMULATION');
+        pushPoint(e.data, false);
+      });
+    };
+
+    const recordFetch = (t0, ok) => {
+      const perf = perfRef.current;
+      perf.fetches[perf.fetchHead % PERF_SAMPLES] = { dur: performance.now() - t0, ok, ts: t0 };
+      perf.fetchHead++;
+    };
 
     const fetchData = async () => {
       const now = new Date();
-      const timeLabel = now.toLocaleTimeString('en-US', { hour12: false, hour: "2-digit", minute: "2-digit", second: "2-digit" });
+      const timeLabel = TIME_FMT.format(now);
       
       try {
         // 1. Try to fetch REAL data from Python
-        const response = await fetch('http://localhost:5000/api/metrics');
+        const t0 = performance.now();
+        const response = await fetch('http://localhost:5000/api/metrics').catch((error) => {
+          recordFetch(t0, false);
+          throw error;
+        });
+        recordFetch(t0, response.ok);
         if (!response.ok) throw new Error("Backend offline");
         
         const realData = await response.json();
         
-        setDataSource('LIVE');
         const newPoint = {
           time: realData.timestamp || timeLabel,
           cpu: realData.cpu,
@@ -50,223 +414,269 @@ const App = () => {
           network: realData.network,
         };
 
-        setHistory(prev => {
-          const updated = [...prev, newPoint];
-          return updated.slice(-MAX_HISTORY);
+        setSimulating(false);
+        // Backend just came back from an outage: try to get onto the stream straight away.
+        // Steady-state polls leave socket retries to reconnectTimer and its backoff.
+        if (failCount > 0 || dataSourceRef.current !== 'LIVE') connect();
+        // One render per tick even under the legacy root, where post-await updates aren't batched
+        unstable_batchedUpdates(() => {
+          updateDataSource('LIVE');
+          pushPoint(newPoint, true);
         });
+        failCount = 0;
+        nextProbeAt = 0;
+        perfRef.current.failCount = 0;
 
       } catch (error) {
-        // 2. Fallback to SIMULATION if Python is down
-        setDataSource('SIMULATION');
-        
-        const simPoint = {
-          time: timeLabel,
-          cpu: Math.floor(Math.random() * 30) + 30 + (Math.random() > 0.9 ? 20 : 0),
-          memory: Math.floor(Math.random() * 10) + 60,
-          network: Math.floor(Math.random() * 50) + 20,
-          disk: Math.floor(Math.random() * 5) + 10,
-        };
+        // 2. Fallback to SIMULATION if Python is down, and back off before probing again
+        nextProbeAt = Date.now() + backoffDelay(failCount);
+        failCount++;
+        perfRef.current.failCount = failCount;
+        setSimulating(true);
+      }
+    };
 
-        setHistory(prev => {
-          const updated = [...prev, simPoint];
-          return updated.slice(-MAX_HISTORY);
-        });
+    // Fallback: poll /api/metrics (and simulate if that fails too) while the stream is down.
+    // Self-scheduling, so a slow request never overlaps the next one and backoff just stretches the delay.
+    const nextPollDelay = () => Math.max(POLL_INTERVAL_MS, nextProbeAt - Date.now());
+
+    const startPolling = () => {
+      if (pollTimer !== null || closed || document.hidden) return;
+      const gen = ++pollGen;
+      const tick = async () => {
+        if (!isPausedRef.current) await fetchData();
+        if (gen === pollGen && !closed) pollTimer = setTimeout(tick, nextPollDelay());
+      };
+      pollTimer = setTimeout(tick, nextPollDelay());
+    };
+
+    const stopPolling = () => {
+      pollGen++;
+      clearTimeout(pollTimer);
+      pollTimer = null;
+    };
+
+    // Primary: one persistent socket, the backend pushes a sample per psutil tick.
+    // While it is down we poll, and keep retrying the socket with backoff.
+    const connect = () => {
+      clearTimeout(reconnectTimer);
+      reconnectTimer = null;
+      if (closed || (ws.current && ws.current.readyState !== WebSocket.CLOSED)) return;
+
+      const socket = new WebSocket('ws://localhost:5000/metrics');
+      ws.current = socket;
+      socket.onopen = () => {
+        wsRetries = 0;
+        stopPolling();
+        setSimulating(false);
+        updateDataSource('LIVE');
+        if (streamCommand(isPausedRef.current) === 'pause') socket.send('pause');
+      };
+      socket.onmessage = (e) => {
+        if (isPausedRef.current || document.hidden) {
+          perfRef.current.dropped++;
+          return;
+        }
+        let p;
+        try {
+          p = JSON.parse(e.data);
+        } catch (error) {
+          perfRef.current.dropped++;
+          return;
+        }
+        pushPoint({
+          time: p.timestamp || TIME_FMT.format(new Date()),
+          cpu: p.cpu,
+          memory: p.memory,
+          disk: p.disk,
+          network: p.network,
+        }, true);
+      };
+      // onerror is always followed by onclose, so the fallback only needs to hook the latter
+      socket.onclose = () => {
+        startPolling();
+        reconnectTimer = setTimeout(connect, backoffDelay(wsRetries++));
+      };
+    };
+    connect();
+
+    // Stop fetching (or ask the server to stop pushing) while the tab is hidden; refresh straight away on return
+    const onVisibilityChange = () => {
+      syncSimulation();
+      if (ws.current.readyState === WebSocket.OPEN) {
+        ws.current.send(streamCommand(isPausedRef.current));
+      } else {
+        if (document.hidden) {
+          stopPolling();
+        } else {
+          // Only refresh immediately if we aren't inside a backoff window
+          if (!isPausedRef.current && Date.now() >= nextProbeAt) fetchData();
+          startPolling();
+        }
       }
     };
+    document.addEventListener('visibilitychange', onVisibilityChange);
+
+    return () => {
+      closed = true;
+      document.removeEventListener('visibilitychange', onVisibilityChange);
+      stopPolling();
+      clearTimeout(reconnectTimer);
+      ws.current.onclose = null;
+      ws.current.close();
+      // Release the shared refs so a remount (StrictMode, Fast Refresh) starts from a clean slate
+      ws.current = null;
+      simWorker.current.terminate();
+      simWorker.current = null;
+      simWantedRef.current = false;
+      simRunningRef.current = false;
+    };
+  }, [updateDataSource, syncSimulation]);
+
+  // Tell the server to stop/start emitting instead of dropping samples client-side
+  useEffect(() => {
+    isPausedRef.current = isPaused;
+    syncSimulation();
+    if (ws.current?.readyState === WebSocket.OPEN) {
+      ws.current.send(streamCommand(isPaused));
+    }
+  }, [isPaused, syncSimulation]);
+
+  // Newest sample, read straight from the ring buffer once per landed sample
+  const latest = useMemo(
+    () => (headRef.current ? bufRef.current[(headRef.current - 1) % MAX_HISTORY] : EMPTY_SAMPLE),
+    [historyVersion]
+  );
+
+  // --- Chart Throttle: samples always land in the buffer, the chart redraws at most every CHART_THROTTLE_MS ---
+  useEffect(() => {
+    if (historyVersion === 0 || chartTimerRef.current) return;
+    const wait = Math.max(0, CHART_THROTTLE_MS - (Date.now() - lastChartFlushRef.current));
+    chartTimerRef.current = setTimeout(() => {
+      chartTimerRef.current = null;
+      lastChartFlushRef.current = Date.now();
+      setChartVersion(v => v + 1);
+    }, wait);
+  }, [historyVersion]);
+
+  useEffect(() => () => clearTimeout(chartTimerRef.current), []);
 
-    const interval = setInterval(fetchData, 1000);
-    return () => clearInterval(interval);
-  }, [isPaused]);
+  const chartData = useMemo(() => readRing(bufRef.current, headRef.current), [chartVersion]);
+
+  const perfStats = useMemo(() => (showPerf ? summarizePerf(perfRef.current) : null), [showPerf, chartVersion]);
 
   // --- AI Functions ---
-  const callGemini = async (prompt, title) => {
+  const callGemini = useCallback(async (prompt, title, cacheKey) => {
     setAiTitle(title);
     setAiModalOpen(true);
+    aiAbortRef.current?.abort();
+
+    // Serve repeated prompts from the session cache (and bump them to most-recently-used)
+    const cached = cacheKey && aiCache.current.get(cacheKey);
+    if (cached) {
+      aiCache.current.delete(cacheKey);
+      aiCache.current.set(cacheKey, cached);
+      setAiLoading(false);
+      setAiResponse(cached);
+      return;
+    }
+
+    const controller = new AbortController();
+    aiAbortRef.current = controller;
     setAiLoading(true);
     setAiResponse('');
 
     try {
-      const apiKey = ""; // System provides this at runtime. 
-      // NOTE: In a local React app, you might need to hardcode your key here temporarily or use process.env.REACT_APP_GEMINI_KEY
+      // NOTE: Don't put a real key here or in a REACT_APP_* env var -- anything in this file ships in the JS bundle.
+      // The key belongs behind the Python backend (proxy this call through it); until then requests go out unauthenticated.
+      const apiKey = "";
       
-      const response = await fetch(`https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash-preview-09-2025:generateContent?key=${apiKey}`, {
+      const response = await fetch('https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash-preview-09-2025:generateContent', {
         method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({ contents: [{ parts: [{ text: prompt }] }] })
+        headers: { 'Content-Type': 'application/json', 'x-goog-api-key': apiKey },
+        body: JSON.stringify({ contents: [{ parts: [{ text: prompt }] }] }),
+        signal: controller.signal,
       });
 
       const data = await response.json();
-      const text = data.candidates?.[0]?.content?.parts?.[0]?.text || "No analysis available.";
-      setAiResponse(text);
+      const text = data.candidates?.[0]?.content?.parts?.[0]?.text;
+      if (text && cacheKey) {
+        aiCache.current.set(cacheKey, text);
+        if (aiCache.current.size > AI_CACHE_SIZE) aiCache.current.delete(aiCache.current.keys().next().value);
+      }
+      if (aiAbortRef.current === controller) setAiResponse(text || "No analysis available.");
     } catch (error) {
-      setAiResponse(`Diagnostic failed: ${error.message}.`);
+      if (error.name !== 'AbortError') setAiResponse(`Diagnostic failed: ${error.message}.`);
     } finally {
-      setAiLoading(false);
+      if (aiAbortRef.current === controller) {
+        aiAbortRef.current = null;
+        setAiLoading(false);
+      }
     }
-  };
+  }, []);
 
-  const handleFullDiagnostics = () => {
-    if (history.length === 0) return;
-    const current = history[history.length - 1];
+  // Don't leave a diagnostics request running after the dashboard goes away
+  useEffect(() => () => aiAbortRef.current?.abort(), []);
+
+  // Reads the newest sample from the ring buffer so the callback (and Header) stays stable across ticks
+  const handleFullDiagnostics = useCallback(() => {
+    if (headRef.current === 0) return;
+    const current = bufRef.current[(headRef.current - 1) % MAX_HISTORY];
     
-    const prompt = `Act as a Senior SRE. Analyze my system (${dataSource} Mode):
+    const prompt = `Act as a Senior SRE. Analyze my system (${dataSourceRef.current} Mode):
     CPU: ${current.cpu}%, RAM: ${current.memory}%, Disk: ${current.disk}%.
     Give a 1-sentence status and 1 actionable tip.`;
 
-    callGemini(prompt, "System Diagnostics");
-  };
+    // Readings within the same 5% bucket would get the same advice
+    const cacheKey = `${dataSourceRef.current}|${Math.round(current.cpu / 5)}|${Math.round(current.memory / 5)}|${Math.round(current.disk / 5)}`;
+    callGemini(prompt, "System Diagnostics", cacheKey);
+  }, [callGemini]);
 
-  // --- UI Components ---
-  const MetricCard = ({ title, value, unit, icon: Icon, metricKey, color, trend }) => (
-    <button 
-      onClick={() => setSelectedMetric(metricKey)}
-      className={`relative group overflow-hidden rounded-2xl border p-5 text-left transition-all duration-300 ${
-        selectedMetric === metricKey 
-          ? `bg-${color}-500/10 border-${color}-500/50 ring-1 ring-${color}-500/50` 
-          : 'bg-zinc-900/50 border-white/5 hover:bg-zinc-800/50 hover:border-white/10'
-      }`}
-    >
-      <div className="flex justify-between items-start mb-4">
-        <div className={`p-2 rounded-lg bg-${color}-500/20 text-${color}-400`}>
-          <Icon size={20} />
-        </div>
-        <span className={`text-xs font-mono px-2 py-1 rounded-full ${
-          trend === 'up' ? 'bg-red-500/20 text-red-400' : 'bg-emerald-500/20 text-emerald-400'
-        }`}>
-          {trend === 'up' ? '↑ High' : '↓ Stable'}
-        </span>
-      </div>
-      <div>
-        <p className="text-zinc-500 text-xs font-medium uppercase tracking-wider">{title}</p>
-        <h3 className="text-2xl font-bold text-white mt-1">
-          {value} <span className="text-sm text-zinc-500 font-normal">{unit}</span>
-        </h3>
-      </div>
-      {selectedMetric === metricKey && (
-        <div className={`absolute bottom-0 left-0 w-full h-1 bg-${color}-500 animate-pulse`} />
-      )}
-    </button>
-  );
+  const togglePause = useCallback(() => setIsPaused(p => !p), []);
+  const closeAiModal = useCallback(() => {
+    aiAbortRef.current?.abort();
+    setAiModalOpen(false);
+  }, []);
 
   return (
     <div className="min-h-screen bg-[#09090b] text-zinc-100 font-sans selection:bg-blue-500/30 flex overflow-hidden relative">
       
       {/* AI Modal */}
       {aiModalOpen && (
-        <div className="fixed inset-0 z-50 flex items-center justify-center bg-black/80 backdrop-blur-sm p-4 animate-in fade-in duration-200">
-          <div className="bg-zinc-900 border border-zinc-700 w-full max-w-lg rounded-2xl shadow-2xl overflow-hidden flex flex-col max-h-[80vh]">
-            <div className="p-4 border-b border-zinc-800 flex items-center justify-between bg-zinc-900/50">
-              <h3 className="font-semibold text-blue-400 flex items-center gap-2">
-                <Sparkles size={18} /> {aiTitle}
-              </h3>
-              <button onClick={() => setAiModalOpen(false)} className="p-1 hover:bg-zinc-800 rounded-lg">
-                <X size={20} className="text-zinc-500" />
-              </button>
-            </div>
-            <div className="p-6 overflow-y-auto bg-zinc-950/50">
-              {aiLoading ? (
-                <div className="flex flex-col items-center justify-center py-12 gap-4">
-                  <Loader2 size={32} className="animate-spin text-blue-500" />
-                  <p className="text-zinc-500 text-sm animate-pulse">Analyzing...</p>
-                </div>
-              ) : (
-                <p className="whitespace-pre-wrap leading-relaxed text-zinc-300">{aiResponse}</p>
-              )}
-            </div>
-          </div>
-        </div>
+        <Suspense fallback={null}>
+          <AiModal title={aiTitle} loading={aiLoading} response={aiResponse} onClose={closeAiModal} />
+        </Suspense>
       )}
 
       {/* Sidebar */}
-      <aside className="w-20 lg:w-64 border-r border-white/5 flex flex-col bg-zinc-900/30 backdrop-blur-xl">
-        <div className="p-6 flex items-center gap-3 text-blue-500">
-          <BrainCircuit size={28} className="animate-pulse" />
-          <span className="font-bold text-xl tracking-tight hidden lg:block text-white">Sentin<span className="text-blue-500">el</span></span>
-        </div>
-        <nav className="flex-1 px-4 py-6 space-y-2">
-          {[{ id: 'dashboard', icon: LayoutDashboard, label: 'Overview' }, { id: 'network', icon: Network, label: 'Network' }, { id: 'logs', icon: Terminal, label: 'Logs' }].map(item => (
-            <button key={item.id} onClick={() => setActiveView(item.id)} className={`w-full flex items-center gap-3 px-4 py-3 rounded-xl transition-all ${activeView === item.id ? 'bg-blue-600/10 text-blue-400 border border-blue-600/20' : 'text-zinc-500 hover:bg-white/5'}`}>
-              <item.icon size={20} />
-              <span className="hidden lg:block text-sm font-medium">{item.label}</span>
-              {activeView === item.id && <ChevronRight size={14} className="ml-auto hidden lg:block" />}
-            </button>
-          ))}
-        </nav>
-      </aside>
+      <Sidebar activeView={activeView} onSelect={setActiveView} />
 
       {/* Main Content */}
       <main className="flex-1 flex flex-col h-screen overflow-hidden relative">
         <div className="absolute inset-0 bg-[url('https://grainy-gradients.vercel.app/noise.svg')] opacity-20 pointer-events-none"></div>
 
-        <header className="h-16 border-b border-white/5 flex items-center justify-between px-8 bg-zinc-900/30 backdrop-blur-sm z-10">
-          <div className="flex items-center gap-4">
-            <h2 className="text-lg font-semibold">System Overview</h2>
-            <div className={`px-3 py-1 rounded-full border flex items-center gap-2 ${dataSource === 'LIVE' ? 'bg-emerald-500/10 border-emerald-500/20' : 'bg-amber-500/10 border-amber-500/20'}`}>
-              <div className={`w-1.5 h-1.5 rounded-full animate-pulse ${dataSource === 'LIVE' ? 'bg-emerald-500' : 'bg-amber-500'}`}></div>
-              <span className={`text-xs font-medium ${dataSource === 'LIVE' ? 'text-emerald-400' : 'text-amber-400'}`}>
-                {dataSource === 'LIVE' ? 'Connected to Localhost' : 'Simulation Mode'}
-              </span>
-            </div>
-          </div>
-          <button onClick={handleFullDiagnostics} className="flex items-center gap-2 px-4 py-1.5 bg-blue-600 hover:bg-blue-500 text-white rounded-full text-sm font-medium shadow-lg shadow-blue-500/20 transition-all">
-            <Sparkles size={14} /> AI Diagnostics
-          </button>
-        </header>
+        <Header dataSource={dataSource} onDiagnostics={handleFullDiagnostics} />
 
         <div className="flex-1 overflow-y-auto p-8 z-0">
           <div className="max-w-7xl mx-auto space-y-6">
-            <div className="grid grid-cols-1 md:grid-cols-4 gap-4">
-              <MetricCard title="CPU" value={history[history.length-1]?.cpu || 0} unit="%" icon={Cpu} metricKey="cpu" color="blue" trend="up" />
-              <MetricCard title="RAM" value={history[history.length-1]?.memory || 0} unit="%" icon={Database} metricKey="memory" color="purple" trend="down" />
-              <MetricCard title="DISK" value={history[history.length-1]?.disk || 0} unit="%" icon={HardDrive} metricKey="disk" color="amber" trend="down" />
-              <MetricCard title="NET" value={history[history.length-1]?.network || 0} unit="Mb" icon={Activity} metricKey="network" color="emerald" trend="down" />
-            </div>
-
-            <div className="bg-zinc-900/50 border border-white/5 rounded-2xl p-6 backdrop-blur-sm h-[400px]">
-              <div className="flex justify-between mb-4">
-                <h3 className="text-lg font-semibold flex gap-2 items-center text-white">
-                  <Activity size={18} className="text-blue-400"/> Real-time Monitor ({selectedMetric.toUpperCase()})
-                </h3>
-                <div className="flex gap-2">
-                  <button onClick={() => setIsPaused(!isPaused)} className="p-2 border border-zinc-700 rounded-lg text-zinc-400 hover:text-white">
-                    {isPaused ? <Play size={16} /> : <Pause size={16} />}
-                  </button>
-                </div>
-              </div>
-              <ResponsiveContainer width="100%" height="100%">
-                <AreaChart data={history}>
-                  <defs>
-                    <linearGradient id="chartGradient" x1="0" y1="0" x2="0" y2="1">
-                      <stop offset="5%" stopColor="#3b82f6" stopOpacity={0.3}/>
-                      <stop offset="95%" stopColor="#3b82f6" stopOpacity={0}/>
-                    </linearGradient>
-                  </defs>
-                  <CartesianGrid strokeDasharray="3 3" stroke="#27272a" vertical={false} />
-                  <XAxis dataKey="time" stroke="#52525b" fontSize={10} tickLine={false} axisLine={false} />
-                  <YAxis stroke="#52525b" fontSize={10} tickLine={false} axisLine={false} />
-                  <Tooltip contentStyle={{ backgroundColor: '#09090b', borderColor: '#27272a' }} itemStyle={{ color: '#fff' }} />
-                  <Area type="monotone" dataKey={selectedMetric} stroke="#3b82f6" strokeWidth={2} fill="url(#chartGradient)" />
-                </AreaChart>
-              </ResponsiveContainer>
-            </div>
+            <MetricsGrid cpu={latest.cpu} memory={latest.memory} disk={latest.disk} network={latest.network} selectedMetric={selectedMetric} onSelect={setSelectedMetric} />
+
+            <ChartPanel chartData={chartData} selectedMetric={selectedMetric} isPaused={isPaused} onTogglePause={togglePause} />
             
-             {/* Methodology Toggle */}
-            <div className="bg-zinc-900/30 border border-white/10 rounded-2xl p-6 flex justify-between items-center">
-               <div>
-                 <h3 className="font-bold text-white mb-1">Analysis Method</h3>
-                 <p className="text-zinc-500 text-sm">
-                   {activeMethod === 'USE' ? "Utilization • Saturation • Errors (Best for Hardware)" : "Rate • Errors • Duration (Best for APIs)"}
-                 </p>
-               </div>
-               <div className="bg-black/40 p-1 rounded-xl border border-white/5 flex">
-                 <button onClick={() => setActiveMethod('USE')} className={`px-4 py-2 rounded-lg text-xs font-bold ${activeMethod === 'USE' ? 'bg-zinc-800 text-white' : 'text-zinc-500'}`}>U.S.E.</button>
-                 <button onClick={() => setActiveMethod('RED')} className={`px-4 py-2 rounded-lg text-xs font-bold ${activeMethod === 'RED' ? 'bg-zinc-800 text-white' : 'text-zinc-500'}`}>R.E.D.</button>
-               </div>
-            </div>
+            {/* Methodology Toggle */}
+            <MethodToggle activeMethod={activeMethod} onSelect={setActiveMethod} />
 
           </div>
         </div>
       </main>
+
+      {/* Perf Overlay (?perf) */}
+      {perfStats && (
+        <div className="fixed bottom-4 right-4 z-40 px-3 py-2 rounded-lg bg-black/80 border border-white/10 font-mono text-[10px] text-zinc-400 space-y-0.5">
+          <p>fetch p50 {perfStats.p50}ms · p95 {perfStats.p95}ms · {perfStats.errors}/{perfStats.fetches} err</p>
+          <p>backoff {perfStats.failCount} · cache hits {perfStats.cacheHits} · dropped {perfStats.dropped}</p>
+        </div>
+      )}
       
       {/* Global CSS */}
       <style>{`
@@ -0,0 +1,26 @@
+// --- Simulation Worker ---
+// Generates fake metrics off the UI thread while the Python backend is unreachable.
+// Emits one sample per second between 'start' and 'stop' messages.
+let timer = null;
+
+// Reused for every sample
+const TIME_FMT = new Intl.DateTimeFormat('en-US', { hour12: false, hour: "2-digit", minute: "2-digit", second: "2-digit" });
+
+const sample = () => ({
+  time: TIME_FMT.format(new Date()),
+  cpu: Math.floor(Math.random() * 30) + 30 + (Math.random() > 0.9 ? 20 : 0),
+  memory: Math.floor(Math.random() * 10) + 60,
+  network: Math.floor(Math.random() * 50) + 20,
+  disk: Math.floor(Math.random() * 5) + 10,
+});
+
+// eslint-disable-next-line no-restricted-globals
+self.onmessage = (e) => {
+  if (e.data === 'start' && timer === null) {
+    postMessage(sample());
+    timer = setInterval(() => postMessage(sample()), 1000);
+  } else if (e.data === 'stop') {
+    clearInterval(timer);
+    timer = null;
+  }
+};